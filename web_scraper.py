@@ -2,6 +2,8 @@ import customtkinter as ctk
 import requests
 from bs4 import BeautifulSoup
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from urllib.parse import urlparse, urljoin
 import threading
 import json
@@ -11,7 +13,253 @@ import os
 import re
 from datetime import datetime
 import logging
-from typing import Dict, List, Optional
+import sqlite3
+import sys
+from enum import IntEnum
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class ResultType(IntEnum):
+    """Тип извлеченного элемента"""
+    LINK = 0
+    H1 = 1
+    H2 = 2
+    H3 = 3
+    TEXT = 4
+
+    @property
+    def label(self) -> str:
+        """Локализованное название типа"""
+        return RESULT_TYPE_LABELS[self]
+
+
+RESULT_TYPE_LABELS = {
+    ResultType.LINK: 'Ссылка',
+    ResultType.H1: 'Заголовок (h1)',
+    ResultType.H2: 'Заголовок (h2)',
+    ResultType.H3: 'Заголовок (h3)',
+    ResultType.TEXT: 'Текст',
+}
+
+HEADER_TYPES = {'h1': ResultType.H1, 'h2': ResultType.H2, 'h3': ResultType.H3}
+
+# Размер группы строк при колоночном экспорте
+ARROW_BATCH_SIZE = 100_000
+
+# Форматы, для которых доступно разбиение на каталоги
+COLUMNAR_FORMATS = ("Parquet (.parquet)", "Arrow IPC (.arrow)")
+
+ARROW_SCHEMA = pa.schema([
+    ('type', pa.dictionary(pa.int8(), pa.string())),
+    ('text', pa.string()),
+    ('url', pa.dictionary(pa.int32(), pa.string())),
+])
+
+
+class ResultRecord:
+    """Компактная запись результата"""
+    __slots__ = ('type', 'text', 'url')
+
+    def __init__(self, type: ResultType, text: str, url: str = ''):
+        self.type = type
+        self.text = text
+        # Одни и те же URL встречаются на многих страницах
+        self.url = sys.intern(url) if url else ''
+
+    def as_dict(self) -> Dict:
+        """Представление записи в виде словаря для экспорта"""
+        return {'type': self.type.label, 'text': self.text, 'url': self.url}
+
+
+class ResultStats:
+    """Счетчики результатов, обновляемые при добавлении"""
+
+    def __init__(self):
+        self.counts = [0] * len(ResultType)
+        self.total = 0
+
+    def add(self, records: Iterable[ResultRecord]):
+        for record in records:
+            self.counts[record.type] += 1
+            self.total += 1
+
+    @property
+    def links(self) -> int:
+        return self.counts[ResultType.LINK]
+
+    @property
+    def headers(self) -> int:
+        return sum(self.counts[ResultType.H1:ResultType.H3 + 1])
+
+    @property
+    def texts(self) -> int:
+        return self.counts[ResultType.TEXT]
+
+
+class ResultStore:
+    """Хранилище результатов в SQLite с полнотекстовым индексом (FTS5)"""
+
+    def __init__(self, db_path: str = 'results.db'):
+        self.db_path = db_path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        # WAL позволяет искать, не дожидаясь записи результатов обхода
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.read_lock = threading.Lock()
+        self.read_conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.fts_enabled = True
+        # Результаты прошлого обхода остаются доступными для поиска
+        self.create_tables()
+
+    def create_tables(self):
+        """Создание таблиц и индексов, если их еще нет"""
+        with self.lock, self.conn:
+            self.conn.executescript("""
+                CREATE TABLE IF NOT EXISTS results (
+                    id INTEGER PRIMARY KEY,
+                    type INTEGER NOT NULL,
+                    text TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    depth INTEGER NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_results_type ON results(type);
+                CREATE INDEX IF NOT EXISTS idx_results_source ON results(source);
+                CREATE INDEX IF NOT EXISTS idx_results_depth ON results(depth);
+            """)
+            fts_exists = self.conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'results_fts'"
+            ).fetchone()
+            try:
+                self.conn.execute("""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS results_fts USING fts5(
+                        text, url, content='results', content_rowid='id'
+                    )
+                """)
+                if not fts_exists:
+                    # Индексирование строк, записанных без FTS5
+                    self.conn.execute("INSERT INTO results_fts (results_fts) VALUES ('rebuild')")
+                self.fts_enabled = True
+            except sqlite3.OperationalError:
+                # SQLite собран без FTS5 - поиск через LIKE
+                self.fts_enabled = False
+
+    def reset(self):
+        """Очистка хранилища перед новым обходом"""
+        with self.lock, self.conn:
+            self.conn.executescript("""
+                DROP TABLE IF EXISTS results_fts;
+                DROP TABLE IF EXISTS results;
+            """)
+        self.create_tables()
+
+    def add_results(self, results: List[ResultRecord], source: str, depth: int):
+        """Добавление результатов одной страницы одной транзакцией"""
+        rows = [
+            (int(record.type), record.text, record.url, source, depth)
+            for record in results
+        ]
+        with self.lock, self.conn:
+            first_id = self.conn.execute(
+                "SELECT COALESCE(MAX(id), 0) + 1 FROM results"
+            ).fetchone()[0]
+            self.conn.executemany(
+                "INSERT INTO results (type, text, url, source, depth) VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            if self.fts_enabled:
+                self.conn.execute(
+                    "INSERT INTO results_fts (rowid, text, url) "
+                    "SELECT id, text, url FROM results WHERE id >= ?",
+                    (first_id,)
+                )
+
+    def build_query(self, query: str, types: Optional[List[ResultType]]) -> Tuple[str, List]:
+        """Условие поиска: FROM ... WHERE ... и его параметры"""
+        terms = re.findall(r'\w+', query)
+        if not terms:
+            return "", []
+
+        if self.fts_enabled:
+            # Каждое слово экранируется и ищется по префиксу
+            match = ' '.join(f'"{term}"*' for term in terms)
+            # CROSS JOIN закрепляет порядок: сначала FTS, затем фильтр по типу
+            sql_from = (
+                "FROM results_fts CROSS JOIN results r ON r.id = results_fts.rowid "
+                "WHERE results_fts MATCH ?"
+            )
+            params = [match]
+        else:
+            # '_' и '%' в словах не должны работать как шаблоны LIKE
+            patterns = [
+                '%' + re.sub(r'([\\%_])', r'\\\1', term) + '%'
+                for term in terms
+            ]
+            sql_from = "FROM results r WHERE " + " AND ".join(
+                "(r.text LIKE ? ESCAPE '\\' OR r.url LIKE ? ESCAPE '\\')" for _ in terms
+            )
+            params = [value for pattern in patterns for value in (pattern, pattern)]
+
+        if types:
+            sql_from += f" AND r.type IN ({', '.join('?' * len(types))})"
+            params.extend(int(result_type) for result_type in types)
+
+        return sql_from, params
+
+    def count(self, query: str, types: Optional[List[ResultType]] = None) -> int:
+        """Количество найденных элементов"""
+        sql_from, params = self.build_query(query, types)
+        if not sql_from:
+            return 0
+        if self.fts_enabled and not types:
+            # Без фильтра по типу соединение с results не нужно
+            sql_from = "FROM results_fts WHERE results_fts MATCH ?"
+
+        with self.read_lock:
+            return self.read_conn.execute(f"SELECT COUNT(*) {sql_from}", params).fetchone()[0]
+
+    def search(self, query: str, types: Optional[List[ResultType]] = None,
+               limit: int = 50, offset: int = 0) -> List[Dict]:
+        """Страница ранжированных результатов поиска по тексту и URL"""
+        sql_from, params = self.build_query(query, types)
+        if not sql_from:
+            return []
+
+        columns = "r.type, r.text, r.url, r.source, r.depth"
+        if self.fts_enabled and not types:
+            # Ранжирование и LIMIT по индексу, соединение только для страницы
+            sql = (
+                f"SELECT {columns} FROM ("
+                "SELECT rowid, rank FROM results_fts WHERE results_fts MATCH ? "
+                "ORDER BY rank LIMIT ? OFFSET ?"
+                ") hits JOIN results r ON r.id = hits.rowid ORDER BY hits.rank"
+            )
+        elif self.fts_enabled:
+            sql = f"SELECT {columns} {sql_from} ORDER BY results_fts.rank LIMIT ? OFFSET ?"
+        else:
+            sql = f"SELECT {columns} {sql_from} ORDER BY r.id LIMIT ? OFFSET ?"
+
+        with self.read_lock:
+            rows = self.read_conn.execute(sql, params + [limit, offset]).fetchall()
+
+        return [
+            {
+                'type': ResultType(row[0]).label,
+                'text': row[1],
+                'url': row[2],
+                'source': row[3],
+                'depth': row[4]
+            }
+            for row in rows
+        ]
+
+    def close(self):
+        """Закрытие соединения с базой"""
+        with self.lock:
+            self.conn.close()
+        with self.read_lock:
+            self.read_conn.close()
+
 
 class WebScraperGUI:
     def __init__(self):
@@ -31,9 +279,21 @@ class WebScraperGUI:
         self.root.geometry("1000x800")
         
         # Инициализация переменных
-        self.results_data = None
+        self.results_data: List[ResultRecord] = []
+        self.results_stats = ResultStats()
+        self.rendered_count = 0
+        self.results_store = ResultStore()
         self.current_url = None
+        self.crawl_started = datetime.now()
+        self.max_depth = 1
         self.is_scraping = False
+        self.search_active = False
+        self.search_generation = 0
+        self.search_query = None
+        self.search_types = None
+        self.search_total = None
+        self.search_offset = 0
+        self.search_page_size = 50
         
         # Создаем и размещаем элементы интерфейса
         self.create_widgets()
@@ -266,13 +526,27 @@ class WebScraperGUI:
                 "JSON (.json)",
                 "HTML (.html)",
                 "Markdown (.md)",
-                "Text (.txt)"
+                "Text (.txt)",
+                "Parquet (.parquet)",
+                "Arrow IPC (.arrow)"
             ],
             variable=self.export_format,
+            command=self.on_export_format_changed,
             font=ctk.CTkFont(size=13)
         )
         self.format_menu.pack(side="left", padx=5)
         
+        # Разбиение колоночного экспорта
+        self.partition_var = ctk.StringVar(value="Без разбиения")
+        self.partition_menu = ctk.CTkOptionMenu(
+            buttons_frame,
+            values=["Без разбиения", "По хосту", "По дате"],
+            variable=self.partition_var,
+            font=ctk.CTkFont(size=13)
+        )
+        self.partition_menu.pack(side="left", padx=5)
+        self.on_export_format_changed(self.export_format.get())
+        
         # Переключатель темы
         self.theme_switch = ctk.CTkSwitch(
             buttons_frame,
@@ -300,6 +574,63 @@ class WebScraperGUI:
         )
         self.stats_label.pack(pady=5)
         
+        # Поиск по результатам
+        search_frame = ctk.CTkFrame(results_frame)
+        search_frame.pack(fill="x", padx=10, pady=(0, 5))
+        
+        self.search_entry = ctk.CTkEntry(
+            search_frame,
+            placeholder_text="Поиск по тексту и URL...",
+            font=ctk.CTkFont(size=13)
+        )
+        self.search_entry.pack(side="left", fill="x", expand=True, padx=5, pady=5)
+        self.search_entry.bind("<Return>", lambda event: self.run_search())
+        self.search_entry.bind("<KeyRelease>", lambda event: self.on_search_edited())
+        
+        self.search_type_var = ctk.StringVar(value="Все")
+        search_type_menu = ctk.CTkOptionMenu(
+            search_frame,
+            values=["Все", "Ссылки", "Заголовки", "Текст"],
+            variable=self.search_type_var,
+            width=110,
+            font=ctk.CTkFont(size=13)
+        )
+        search_type_menu.pack(side="left", padx=5)
+        
+        search_button = ctk.CTkButton(
+            search_frame,
+            text="Найти",
+            command=self.run_search,
+            width=80,
+            font=ctk.CTkFont(size=13)
+        )
+        search_button.pack(side="left", padx=5)
+        
+        self.prev_page_button = ctk.CTkButton(
+            search_frame,
+            text="<",
+            command=lambda: self.change_search_page(-1),
+            width=30,
+            state="disabled"
+        )
+        self.prev_page_button.pack(side="left", padx=(5, 0))
+        
+        self.search_page_label = ctk.CTkLabel(
+            search_frame,
+            text="",
+            font=ctk.CTkFont(size=13)
+        )
+        self.search_page_label.pack(side="left", padx=5)
+        
+        self.next_page_button = ctk.CTkButton(
+            search_frame,
+            text=">",
+            command=lambda: self.change_search_page(1),
+            width=30,
+            state="disabled"
+        )
+        self.next_page_button.pack(side="left", padx=(0, 5))
+        
         # Результаты
         self.results_text = ctk.CTkTextbox(
             results_frame,
@@ -324,6 +655,11 @@ class WebScraperGUI:
         self.progress_bar.pack(side="left", fill="x", expand=True, pady=5, padx=10)
         self.progress_bar.set(0)
 
+    def on_export_format_changed(self, selected_format: str):
+        """Разбиение доступно только для колоночных форматов"""
+        state = "normal" if selected_format in COLUMNAR_FORMATS else "disabled"
+        self.partition_menu.configure(state=state)
+
     def toggle_theme(self):
         """Переключение темы оформления"""
         current_mode = ctk.get_appearance_mode()
@@ -345,15 +681,19 @@ class WebScraperGUI:
             url = 'https://' + url
             
         self.current_url = url
+        self.crawl_started = datetime.now()
+        self.max_depth = int(self.depth_var.get())
         self.is_scraping = True
-        self.results_data = pd.DataFrame()
-        self.results_text.delete("0.0", "end")
+        self.results_data = []
+        self.results_stats = ResultStats()
+        self.results_store.reset()
+        self.leave_search()
         self.progress_label.configure(text="Извлечение данных...")
         self.progress_bar.start()
         self.scrape_button.configure(state="disabled")
         self.export_button.configure(state="disabled")
         
-        thread = threading.Thread(target=self.scrape_url, args=(url, int(self.depth_var.get())))
+        thread = threading.Thread(target=self.scrape_url, args=(url, self.max_depth))
         thread.daemon = True
         thread.start()
 
@@ -390,8 +730,9 @@ class WebScraperGUI:
             
             # Добавление результатов
             if results:
-                new_data = pd.DataFrame(results)
-                self.results_data = pd.concat([self.results_data, new_data], ignore_index=True)
+                self.results_data.extend(results)
+                self.results_stats.add(results)
+                self.results_store.add_results(results, url, self.max_depth - depth)
                 self.root.after(0, self.update_results)
             
             # Рекурсивный обход ссылок
@@ -411,45 +752,33 @@ class WebScraperGUI:
             self.is_scraping = False
             self.root.after(0, self.finalize_scraping)
 
-    def extract_links_data(self, soup: BeautifulSoup, base_url: str) -> List[Dict]:
+    def extract_links_data(self, soup: BeautifulSoup, base_url: str) -> List[ResultRecord]:
         """Извлечение ссылок"""
         results = []
         for link in soup.find_all('a'):
             if href := link.get('href'):
                 if not href.startswith(('http://', 'https://')):
                     href = urljoin(base_url, href)
-                results.append({
-                    'type': 'Ссылка',
-                    'text': link.text.strip(),
-                    'url': href
-                })
+                results.append(ResultRecord(ResultType.LINK, link.text.strip(), href))
         return results
 
-    def extract_headers_data(self, soup: BeautifulSoup) -> List[Dict]:
+    def extract_headers_data(self, soup: BeautifulSoup) -> List[ResultRecord]:
         """Извлечение заголовков"""
         results = []
-        for tag in ['h1', 'h2', 'h3']:
+        for tag, result_type in HEADER_TYPES.items():
             for header in soup.find_all(tag):
-                results.append({
-                    'type': f'Заголовок ({tag})',
-                    'text': header.text.strip(),
-                    'url': ''
-                })
+                results.append(ResultRecord(result_type, header.text.strip()))
         return results
 
-    def extract_text_data(self, soup: BeautifulSoup) -> List[Dict]:
+    def extract_text_data(self, soup: BeautifulSoup) -> List[ResultRecord]:
         """Извлечение текста"""
         results = []
         for p in soup.find_all('p'):
             if text := p.text.strip():
-                results.append({
-                    'type': 'Текст',
-                    'text': text,
-                    'url': ''
-                })
+                results.append(ResultRecord(ResultType.TEXT, text))
         return results
 
-    def apply_filters(self, results: List[Dict]) -> List[Dict]:
+    def apply_filters(self, results: List[ResultRecord]) -> List[ResultRecord]:
         """Применение фильтров к результатам"""
         filtered_results = []
         
@@ -461,7 +790,7 @@ class WebScraperGUI:
         exclude_pattern = self.exclude_patterns_var.get().strip()
         
         for item in results:
-            text = item['text']
+            text = item.text
             
             # Проверка длины
             if len(text) < min_length:
@@ -477,26 +806,139 @@ class WebScraperGUI:
 
     def update_results(self):
         """Обновление отображения результатов"""
-        if self.results_data is not None and not self.results_data.empty:
-            self.results_text.delete("0.0", "end")
-            
+        if self.results_data:
             # Обновление статистики
             stats = (
-                f"Найдено: {len(self.results_data)} элементов "
-                f"(Ссылок: {len(self.results_data[self.results_data['type'] == 'Ссылка'])}, "
-                f"Заголовков: {len(self.results_data[self.results_data['type'].str.startswith('Заголовок')])}, "
-                f"Текста: {len(self.results_data[self.results_data['type'] == 'Текст'])})"
+                f"Найдено: {self.results_stats.total} элементов "
+                f"(Ссылок: {self.results_stats.links}, "
+                f"Заголовков: {self.results_stats.headers}, "
+                f"Текста: {self.results_stats.texts})"
             )
             self.stats_label.configure(text=stats)
             
-            # Вывод результатов
-            for _, row in self.results_data.iterrows():
-                self.results_text.insert("end", f"Тип: {row['type']}\n")
-                self.results_text.insert("end", f"Текст: {row['text']}\n")
-                if row['url']:
-                    self.results_text.insert("end", f"URL: {row['url']}\n")
+            # Во время поиска текстовое поле занято результатами поиска
+            if self.search_active:
+                return
+            
+            # Вывод только новых результатов
+            new_records = self.results_data[self.rendered_count:]
+            self.rendered_count += len(new_records)
+            for record in new_records:
+                self.results_text.insert("end", f"Тип: {record.type.label}\n")
+                self.results_text.insert("end", f"Текст: {record.text}\n")
+                if record.url:
+                    self.results_text.insert("end", f"URL: {record.url}\n")
                 self.results_text.insert("end", "─" * 50 + "\n")
 
+    def run_search(self):
+        """Запуск нового поиска по результатам"""
+        query = self.search_entry.get().strip()
+        if not query:
+            self.leave_search()
+            return
+        
+        type_mapping = {
+            "Ссылки": [ResultType.LINK],
+            "Заголовки": list(HEADER_TYPES.values()),
+            "Текст": [ResultType.TEXT]
+        }
+        self.search_query = query
+        self.search_types = type_mapping.get(self.search_type_var.get())
+        self.search_total = None
+        self.search_offset = 0
+        self.search_active = True
+        self.start_search()
+
+    def change_search_page(self, step: int):
+        """Переход на соседнюю страницу результатов поиска"""
+        self.search_offset = max(0, self.search_offset + step * self.search_page_size)
+        self.start_search()
+
+    def on_search_edited(self):
+        """Возврат к результатам обхода после очистки поля поиска"""
+        if self.search_active and not self.search_entry.get().strip():
+            self.leave_search()
+
+    def leave_search(self):
+        """Выход из режима поиска и повторный вывод всех результатов"""
+        self.search_active = False
+        self.search_generation += 1
+        self.search_page_label.configure(text="")
+        self.prev_page_button.configure(state="disabled")
+        self.next_page_button.configure(state="disabled")
+        self.results_text.delete("0.0", "end")
+        self.rendered_count = 0
+        self.update_results()
+
+    def start_search(self):
+        """Запуск поиска в отдельном потоке"""
+        self.search_generation += 1
+        self.search_page_label.configure(text="Поиск...")
+        self.prev_page_button.configure(state="disabled")
+        self.next_page_button.configure(state="disabled")
+        
+        thread = threading.Thread(
+            target=self.search_results,
+            args=(
+                self.search_generation,
+                self.search_query,
+                self.search_types,
+                self.search_offset,
+                self.search_total
+            )
+        )
+        thread.daemon = True
+        thread.start()
+
+    def search_results(self, generation: int, query: str, types: Optional[List[ResultType]],
+                       offset: int, total: Optional[int]):
+        """Выполнение запроса к хранилищу (в фоновом потоке)"""
+        try:
+            # Общее количество считается один раз на запрос
+            if total is None:
+                total = self.results_store.count(query, types)
+            hits = self.results_store.search(
+                query,
+                types=types,
+                limit=self.search_page_size,
+                offset=offset
+            )
+        except Exception as e:
+            self.logger.error(f"Ошибка поиска: {e}")
+            self.root.after(0, lambda: self.show_error(f"Ошибка поиска: {str(e)}"))
+            return
+        
+        self.root.after(0, lambda: self.show_search_page(generation, total, hits))
+
+    def show_search_page(self, generation: int, total: int, hits: List[Dict]):
+        """Отображение страницы результатов поиска"""
+        # Ответ на устаревший запрос или поиск уже закрыт
+        if generation != self.search_generation or not self.search_active:
+            return
+        
+        self.search_total = total
+        self.results_text.delete("0.0", "end")
+        for hit in hits:
+            self.results_text.insert("end", f"Тип: {hit['type']}\n")
+            self.results_text.insert("end", f"Текст: {hit['text']}\n")
+            if hit['url']:
+                self.results_text.insert("end", f"URL: {hit['url']}\n")
+            self.results_text.insert("end", f"Страница: {hit['source']} (глубина {hit['depth']})\n")
+            self.results_text.insert("end", "─" * 50 + "\n")
+        
+        if total:
+            first = self.search_offset + 1
+            last = self.search_offset + len(hits)
+            self.search_page_label.configure(text=f"{first}-{last} из {total}")
+        else:
+            self.search_page_label.configure(text="Ничего не найдено")
+        self.prev_page_button.configure(
+            state="normal" if self.search_offset > 0 else "disabled"
+        )
+        self.next_page_button.configure(
+            state="normal" if self.search_offset + len(hits) < total else "disabled"
+        )
+
     def finalize_scraping(self):
         """Завершение процесса извлечения"""
         self.progress_bar.stop()
@@ -524,7 +966,7 @@ class WebScraperGUI:
 
     def export_results(self):
         """Экспорт результатов"""
-        if self.results_data is None or self.results_data.empty:
+        if not self.results_data:
             self.show_error("Нет данных для экспорта")
             return
             
@@ -534,7 +976,9 @@ class WebScraperGUI:
             "JSON (.json)": (".json", self.export_json),
             "HTML (.html)": (".html", self.export_html),
             "Markdown (.md)": (".md", self.export_markdown),
-            "Text (.txt)": (".txt", self.export_text)
+            "Text (.txt)": (".txt", self.export_text),
+            "Parquet (.parquet)": (".parquet", self.export_parquet),
+            "Arrow IPC (.arrow)": (".arrow", self.export_arrow)
         }
         
         selected_format = self.export_format.get()
@@ -547,10 +991,12 @@ class WebScraperGUI:
         
         if file_path:
             try:
+                if selected_format in COLUMNAR_FORMATS:
+                    file_path = self.partition_path(file_path)
                 export_func(file_path)
                 self.logger.info(f"Данные экспортированы в {file_path}")
                 dialog = ctk.CTkInputDialog(
-                    text=f"Файл успешно экспортирован в формате {selected_format}",
+                    text=f"Файл успешно экспортирован в формате {selected_format}:\n{file_path}",
                     title="Успех",
                     button_text="OK"
                 )
@@ -558,17 +1004,28 @@ class WebScraperGUI:
             except Exception as e:
                 self.show_error(f"Ошибка при экспорте файла:\n{str(e)}")
 
+    def results_dataframe(self) -> pd.DataFrame:
+        """Преобразование результатов в DataFrame с категориальным типом"""
+        return pd.DataFrame({
+            'type': pd.Categorical.from_codes(
+                [int(record.type) for record in self.results_data],
+                categories=[result_type.label for result_type in ResultType]
+            ),
+            'text': [record.text for record in self.results_data],
+            'url': [record.url for record in self.results_data]
+        })
+
     def export_excel(self, file_path: str):
         """Экспорт в Excel"""
-        self.results_data.to_excel(file_path, index=False)
+        self.results_dataframe().to_excel(file_path, index=False)
 
     def export_csv(self, file_path: str):
         """Экспорт в CSV"""
-        self.results_data.to_csv(file_path, index=False, encoding='utf-8-sig')
+        self.results_dataframe().to_csv(file_path, index=False, encoding='utf-8-sig')
 
     def export_json(self, file_path: str):
         """Экспорт в JSON"""
-        results = self.results_data.to_dict(orient='records')
+        results = [record.as_dict() for record in self.results_data]
         with open(file_path, 'w', encoding='utf-8') as f:
             json.dump(results, f, ensure_ascii=False, indent=2)
 
@@ -646,14 +1103,14 @@ class WebScraperGUI:
         """)
         
         stats = {
-            'total_items': len(self.results_data),
-            'links_count': len(self.results_data[self.results_data['type'] == 'Ссылка']),
-            'headers_count': len(self.results_data[self.results_data['type'].str.startswith('Заголовок')]),
-            'text_count': len(self.results_data[self.results_data['type'] == 'Текст'])
+            'total_items': self.results_stats.total,
+            'links_count': self.results_stats.links,
+            'headers_count': self.results_stats.headers,
+            'text_count': self.results_stats.texts
         }
         
         html_content = template.render(
-            items=self.results_data.to_dict(orient='records'),
+            items=(record.as_dict() for record in self.results_data),
             **stats
         )
         
@@ -667,17 +1124,17 @@ class WebScraperGUI:
             
             # Статистика
             f.write("## Статистика\n\n")
-            f.write(f"- Всего элементов: {len(self.results_data)}\n")
-            f.write(f"- Ссылок: {len(self.results_data[self.results_data['type'] == 'Ссылка'])}\n")
-            f.write(f"- Заголовков: {len(self.results_data[self.results_data['type'].str.startswith('Заголовок')])}\n")
-            f.write(f"- Текстовых блоков: {len(self.results_data[self.results_data['type'] == 'Текст'])}\n\n")
+            f.write(f"- Всего элементов: {self.results_stats.total}\n")
+            f.write(f"- Ссылок: {self.results_stats.links}\n")
+            f.write(f"- Заголовков: {self.results_stats.headers}\n")
+            f.write(f"- Текстовых блоков: {self.results_stats.texts}\n\n")
             
             # Данные
-            for _, row in self.results_data.iterrows():
-                f.write(f"## {row['type']}\n\n")
-                f.write(f"{row['text']}\n\n")
-                if row['url']:
-                    f.write(f"[Ссылка]({row['url']})\n\n")
+            for record in self.results_data:
+                f.write(f"## {record.type.label}\n\n")
+                f.write(f"{record.text}\n\n")
+                if record.url:
+                    f.write(f"[Ссылка]({record.url})\n\n")
                 f.write("---\n\n")
 
     def export_text(self, file_path: str):
@@ -685,24 +1142,92 @@ class WebScraperGUI:
         with open(file_path, 'w', encoding='utf-8') as f:
             # Статистика
             f.write("=== Web Scraper Results ===\n\n")
-            f.write(f"Всего элементов: {len(self.results_data)}\n")
-            f.write(f"Ссылок: {len(self.results_data[self.results_data['type'] == 'Ссылка'])}\n")
-            f.write(f"Заголовков: {len(self.results_data[self.results_data['type'].str.startswith('Заголовок')])}\n")
-            f.write(f"Текстовых блоков: {len(self.results_data[self.results_data['type'] == 'Текст'])}\n\n")
+            f.write(f"Всего элементов: {self.results_stats.total}\n")
+            f.write(f"Ссылок: {self.results_stats.links}\n")
+            f.write(f"Заголовков: {self.results_stats.headers}\n")
+            f.write(f"Текстовых блоков: {self.results_stats.texts}\n\n")
             f.write("=" * 50 + "\n\n")
             
             # Данные
             f.write(tabulate(
-                self.results_data,
-                headers='keys',
+                ((record.type.label, record.text, record.url) for record in self.results_data),
+                headers=['type', 'text', 'url'],
                 tablefmt='grid',
                 showindex=False
             ))
 
+    def arrow_batches(self, delta_dictionary: bool = False):
+        """Генератор пакетов Arrow ограниченного размера со словарным кодированием"""
+        type_dictionary = pa.array([result_type.label for result_type in ResultType], pa.string())
+        url_codes: Dict[str, int] = {}
+        url_values: List[str] = []
+        
+        for start in range(0, len(self.results_data), ARROW_BATCH_SIZE):
+            chunk = self.results_data[start:start + ARROW_BATCH_SIZE]
+            
+            if delta_dictionary:
+                # Словарь URL только дополняется, поэтому в IPC пишутся дельты
+                indices = []
+                for record in chunk:
+                    code = url_codes.get(record.url)
+                    if code is None:
+                        code = url_codes[record.url] = len(url_values)
+                        url_values.append(record.url)
+                    indices.append(code)
+                urls = pa.DictionaryArray.from_arrays(
+                    pa.array(indices, pa.int32()),
+                    pa.array(url_values, pa.string())
+                )
+            else:
+                # Свой словарь для каждой группы строк Parquet
+                urls = pa.array([record.url for record in chunk], pa.string()).dictionary_encode()
+            
+            yield pa.RecordBatch.from_arrays([
+                pa.DictionaryArray.from_arrays(
+                    pa.array([int(record.type) for record in chunk], pa.int8()),
+                    type_dictionary
+                ),
+                pa.array([record.text for record in chunk], pa.string()),
+                urls,
+            ], schema=ARROW_SCHEMA)
+
+    def partition_path(self, file_path: str) -> str:
+        """Путь файла с учетом разбиения в стиле Hive (key=value)"""
+        partition = self.partition_var.get()
+        if partition == "По хосту":
+            key, value = "seed_host", urlparse(self.current_url).hostname
+        elif partition == "По дате":
+            key, value = "crawl_date", self.crawl_started.strftime("%Y-%m-%d")
+        else:
+            return file_path
+        
+        directory = os.path.join(os.path.dirname(file_path), f"{key}={value}")
+        os.makedirs(directory, exist_ok=True)
+        return os.path.join(directory, os.path.basename(file_path))
+
+    def export_parquet(self, file_path: str):
+        """Экспорт в Parquet"""
+        with pq.ParquetWriter(
+            file_path,
+            ARROW_SCHEMA,
+            use_dictionary=['type', 'url'],
+            compression='zstd'
+        ) as writer:
+            for batch in self.arrow_batches():
+                writer.write_batch(batch, row_group_size=ARROW_BATCH_SIZE)
+
+    def export_arrow(self, file_path: str):
+        """Экспорт в Arrow IPC"""
+        options = pa.ipc.IpcWriteOptions(emit_dictionary_deltas=True)
+        with pa.ipc.new_file(file_path, ARROW_SCHEMA, options=options) as writer:
+            for batch in self.arrow_batches(delta_dictionary=True):
+                writer.write_batch(batch)
+
     def run(self):
         """Запуск приложения"""
         self.root.mainloop()
         self.save_settings()  # Сохранение настроек при закрытии
+        self.results_store.close()
 
 if __name__ == "__main__":
     app = WebScraperGUI()